@@ -51,10 +51,8 @@ Main approach:
 
 from __future__ import annotations
 
-try:
-    from uncertainties import umath as math
-except ImportError:
-    import math  # type: ignore
+import functools
+import math
 
 # Units conversion
 kPa = 0.133322368  # kPa to mmHg, 1 mmHg = 0.133322368 kPa
@@ -77,6 +75,16 @@ norm_ctAlb_mean = 4.4  # g/dL
 norm_ctAlb = (3.5, 5)  # g/dL
 
 
+def enable_uncertainty() -> None:
+    """Use `uncertainties.umath` instead of `math` in this module.
+
+    Allows passing `uncertainties.ufloat` values to propagate measurement
+    error. Much slower than stdlib math, so disabled by default.
+    """
+    global math
+    from uncertainties import umath as math  # noqa: F811
+
+
 def calculate_anion_gap(
     Na: float, Cl: float, HCO3act: float, K: float = 0, albumin: float = norm_ctAlb_mean
 ) -> float:
@@ -201,9 +209,8 @@ def calculate_anion_gap_delta(AG: float, HCO3act: float) -> str:
     # 12 - normal anion gap without potassium
     # 24 - normal HCO3-, mmol/L
     gg = (AG - 12) / (24 - HCO3act)
-    info = ""
-    # info += "Delta gap ({:.1f} - 12) / (24 - {:.1f}) = {:.1f}\n".format(AG, HCO3act, gg)
-    info += "delta ratio {:.1f} ".format(gg)
+    # info = f"Delta gap ({AG:.1f} - 12) / (24 - {HCO3act:.1f}) = {gg:.1f}\n"
+    info = f"delta ratio {gg:.1f} "
     if gg < 0.4:
         # Usually due to mass transfusion of NaCl (dilution acidosis)
         # Normal gap because kidney excrete HCO3-
@@ -399,6 +406,25 @@ def simple_be(pH: float, HCO3act: float) -> float:
     return 0.9287 * HCO3act + 13.77 * pH - 124.58
 
 
+@functools.lru_cache(maxsize=32)
+def _cbase_hb_terms(ctHb: float) -> tuple[float, float, float]:
+    """Hemoglobin-dependent terms of the base excess equation.
+
+    They depend on ctHb only, so are calculated once for each ctHb value
+    (SBE always uses ctHb = 3 mmol/L).
+
+    Args:
+        ctHb: Concentration of total hemoglobin in blood, mmol/L
+
+    Returns:
+        a, pH(Hb), log pCO2(Hb).
+    """
+    a = 4.04 * 10**-3 + 4.25 * 10**-4 * ctHb
+    pHHb = 4.06 * 10**-2 * ctHb + 5.98 - 1.92 * 10 ** (-0.16169 * ctHb)
+    log_pCO2Hb = -1.7674 * (10**-2) * ctHb + 3.4046 + 2.12 * 10 ** (-0.15158 * ctHb)
+    return a, pHHb, log_pCO2Hb
+
+
 def calculate_cbase(pH: float, pCO2: float, ctHb: float = 3) -> float:
     """Calculate base excess.
 
@@ -422,16 +448,15 @@ def calculate_cbase(pH: float, pCO2: float, ctHb: float = 3) -> float:
     Returns:
         Standard base excess (SBE) or actual base excess (ABE), mEq/L.
     """
-    a = 4.04 * 10**-3 + 4.25 * 10**-4 * ctHb
-    pHHb = 4.06 * 10**-2 * ctHb + 5.98 - 1.92 * 10 ** (-0.16169 * ctHb)
-    log_pCO2Hb = -1.7674 * (10**-2) * ctHb + 3.4046 + 2.12 * 10 ** (-0.15158 * ctHb)
+    a, pHHb, log_pCO2Hb = _cbase_hb_terms(ctHb)
     pHst = pH + math.log10(5.33 / pCO2) * (
         (pHHb - pH) / (log_pCO2Hb - math.log10(7.5006 * pCO2))
     )
     cHCO3_533 = 0.23 * 5.33 * 10 ** ((pHst - 6.161) / 0.9524)
     # There is no comments, as there is no place for weak man
+    t = (0.919 - 8 * a) / a
     cBase = 0.5 * ((8 * a - 0.919) / a) + 0.5 * math.sqrt(
-        (((0.919 - 8 * a) / a) ** 2) - 4 * ((24.47 - cHCO3_533) / a)
+        t * t - 4 * ((24.47 - cHCO3_533) / a)
     )
     return cBase
 
@@ -625,6 +650,10 @@ def calculate_Ca74(pH: float, Ca: float) -> float:
     return Ca * (1 - 0.53 * (7.4 - pH))
 
 
+# pH shift per mmHg of pCO2 in simple respiratory acidosis
+resp_acidosis_slope = {"acute": 0.008, "chronic": 0.003}
+
+
 def resp_acidosis_pH(pCO2: float, status: str = "acute") -> float:
     """Calculate expected pH by pCO2 for simple respiratory acidosis.
 
@@ -696,10 +725,32 @@ def resp_acidosis_pH(pCO2: float, status: str = "acute") -> float:
     Returns:
         Expected pH.
     """
-    if status == "acute":
-        return 7.4 + 0.008 * (40.0 - pCO2 / kPa)  # Acute
-    else:
-        return 7.4 + 0.003 * (40.0 - pCO2 / kPa)  # Chronic
+    return 7.4 + resp_acidosis_slope[status] * (40.0 - pCO2 / kPa)
+
+
+def check_metabolic(pH: float, pCO2: float) -> str:
+    """Check metabolic status by expected pH level.
+
+    Does this pH and pCO2 means hidden metabolic process?
+    Used by `abg_approach_stable` for decompensated respiratory disorders.
+
+    Args:
+        pH: pH
+        pCO2: kPa
+
+    Returns:
+        Opinion.
+    """
+    guess = ""
+    # magic_threshold = 0.07
+    magic_threshold = 0.04  # To conform this case: https://web.archive.org/web/20170729124831/http://fitsweb.uchc.edu/student/selectives/TimurGraham/Case_6.html
+    ex_pH = resp_acidosis_pH(pCO2)
+    if abs(pH - ex_pH) > magic_threshold:
+        if pH > ex_pH:
+            guess += "background metabolic alkalosis: "
+        else:
+            guess += "background metabolic acidosis: "
+    return f"{guess}expected pH {ex_pH:.2f}"
 
 
 def abg_approach_stable(pH: float, pCO2: float) -> tuple[str, str | None]:
@@ -720,22 +771,6 @@ def abg_approach_stable(pH: float, pCO2: float) -> tuple[str, str | None]:
     # The answer to that is that if you need more than 3 levels of
     # indentation, you're screwed anyway, and should fix your program.
 
-    def check_metabolic(pH: float, pCO2: float) -> str:
-        """Check metabolic status by expected pH level.
-
-        Does this pH and pCO2 means hidden metabolic process?
-        """
-        guess = ""
-        # magic_threshold = 0.07
-        magic_threshold = 0.04  # To conform this case: https://web.archive.org/web/20170729124831/http://fitsweb.uchc.edu/student/selectives/TimurGraham/Case_6.html
-        ex_pH = resp_acidosis_pH(pCO2)
-        if abs(pH - ex_pH) > magic_threshold:
-            if pH > ex_pH:
-                guess += "background metabolic alkalosis: "
-            else:
-                guess += "background metabolic acidosis: "
-        return "{}expected pH {:.2f}".format(guess, ex_pH)
-
     if norm_pH[0] <= pH <= norm_pH[1]:  # pH is normal or compensated
         # Don't calculate expected CO2/pH values because both values are
         # normal or represent two opposed processes (no need for searching
@@ -780,13 +815,13 @@ def abg_approach_stable(pH: float, pCO2: float) -> tuple[str, str | None]:
                 )
             elif pH > norm_pH[1]:
                 return (
-                    "Respiratory alkalosis ({})".format(check_metabolic(pH, pCO2)),
+                    f"Respiratory alkalosis ({check_metabolic(pH, pCO2)})",
                     "respiratory_alkalosis",
                 )
         elif pCO2 > norm_pCO2[1]:
             if pH < norm_pH[0]:
                 return (
-                    "Respiratory acidosis ({})".format(check_metabolic(pH, pCO2)),
+                    f"Respiratory acidosis ({check_metabolic(pH, pCO2)})",
                     "respiratory_acidosis",
                 )
             elif pH > norm_pH[1]:
@@ -836,15 +871,13 @@ def abg_approach_ryabov(pH: float, pCO2: float) -> str:
     Return:
         Opinion.
     """
-    # Same as `pH_expected = resp_acidosis_pH(pCO2, status='acute')`
-    pH_expected = 7.4 + 0.008 * (40 - pCO2 / kPa)  # What is the original paper?
-    info = "pH, calculated by pCO2, is {:.02f}, ".format(pH_expected)
+    pH_expected = resp_acidosis_pH(pCO2, status="acute")
     pH_diff = pH - pH_expected
     sbe = pH_diff / 0.015
-    info += "estimated SBE ({:.02f}-{:.02f})/0.015={:+.02f} mEq/L".format(
-        pH, pH_expected, sbe
+    return (
+        f"pH, calculated by pCO2, is {pH_expected:.02f}, "
+        f"estimated SBE ({pH:.02f}-{pH_expected:.02f})/0.015={sbe:+.02f} mEq/L"
     )
-    return info
 
 
 def abg_approach_research(pH: float, pCO2: float) -> str:
@@ -860,13 +893,12 @@ def abg_approach_research(pH: float, pCO2: float) -> str:
     Returns:
         Opinion.
     """
-    info = ""
     HCO3act = calculate_hco3p(pH, pCO2)
     # pCO2mmHg = pCO2 / kPa
 
-    info += "pH by pCO2: acute {:.2f}, chronic {:.2f} for primary respiratory condition [AHA?]\n".format(
-        resp_acidosis_pH(pCO2, "acute"), resp_acidosis_pH(pCO2, "chronic")
-    )
+    pH_acute = resp_acidosis_pH(pCO2, "acute")
+    pH_chronic = resp_acidosis_pH(pCO2, "chronic")
+    info = f"pH by pCO2: acute {pH_acute:.2f}, chronic {pH_chronic:.2f} for primary respiratory condition [AHA?]\n"
 
     """
     Winters' formula - checks if respiratory response (pCO2 level) adequate
@@ -878,16 +910,14 @@ def abg_approach_research(pH: float, pCO2: float) -> str:
     """
     wint_ac = 1.5 * HCO3act + 8
     wint_alc = 0.7 * HCO3act + 20
-    info += "pCO2 by cHCO3(P) - expected respiratory compensation [Winters]:\n"
-    info += " * Met. acid. lungs will drop pCO2, but not lower than ≥{:.1f}-{:.1f} mmHg\n".format(
-        wint_ac - 2, wint_ac + 2
-    )
-    info += " * Met. alc. lungs will save pCO2, but not higher than ≤{:.1f}-{:.1f} mmHg\n".format(
-        wint_alc - 1.5, wint_alc + 1.5
+    info += (
+        "pCO2 by cHCO3(P) - expected respiratory compensation [Winters]:\n"
+        f" * Met. acid. lungs will drop pCO2, but not lower than ≥{wint_ac - 2:.1f}-{wint_ac + 2:.1f} mmHg\n"
+        f" * Met. alc. lungs will save pCO2, but not higher than ≤{wint_alc - 1.5:.1f}-{wint_alc + 1.5:.1f} mmHg\n"
     )
     # try:
     #     y = (7.4 - pH) / (pCO2mmHg - 40.0) * 100
-    #     info += "y = ΔpH/ΔpCO2×100 = {:.2f} [needs table p 56 to assess]\n".format(y)
+    #     info += f"y = ΔpH/ΔpCO2×100 = {y:.2f} [needs table p 56 to assess]\n"
     # except ZeroDivisionError:
     #     pass
     return info
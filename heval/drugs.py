@@ -55,6 +55,15 @@ press_dobutamine = {
     "speed_max": 25,  # mcg/kg/min
 }
 
+pressors = (
+    press_nor16,
+    press_nor32,
+    press_epi,
+    press_phenylephrine,
+    press_dopamine,
+    press_dobutamine,
+)
+
 
 class HumanDrugsModel:
     """Human drugs list."""
@@ -77,40 +86,9 @@ class HumanDrugsModel:
         return "\n".join(["* " + str(d) for d in self.drug_list])
 
     def describe_pressors(self):
-        def describe_pressor(pressor, weight):
-            """Generate pressor cheatsheet.
-
-            :param tuple pressor: Pressor typle
-            :param float weight: Human weight, kg.
-            """
-            dilution = pressor["weight"] / pressor["volume"]
-            out_str = "{} ({:3.0f} mg / {:.0f} ml, {:.2f} mg/ml) rate {:.2f}-{:>5.2f} mсg/kg/min".format(
-                pressor["name"],
-                pressor["weight"],
-                pressor["volume"],
-                dilution,
-                pressor["speed_start"],
-                pressor["speed_max"],
-            )
-
-            speed_start_mgh = pressor["speed_start"] / 1000 * weight * 60
-            speed_start_mlh = speed_start_mgh / dilution
-            speed_max_mgh = pressor["speed_max"] / 1000 * weight * 60
-            speed_max_mlh = speed_max_mgh / dilution
-            out_str += f" ({speed_start_mgh:>4.1f}-{speed_max_mgh:>5.1f} mg/h, {speed_start_mlh:.1f}-{speed_max_mlh:>4.1f} ml/h)"
-            return out_str
-
-        info = list()
-        for p in (
-            press_nor16,
-            press_nor32,
-            press_epi,
-            press_phenylephrine,
-            press_dopamine,
-            press_dobutamine,
-        ):
-            info.append(describe_pressor(p, self.parent.weight))
-        return "\n".join(info) + "\n"
+        return (
+            "\n".join(describe_pressor(p, self.parent.weight) for p in pressors) + "\n"
+        )
 
 
 class Suxamethonium:
@@ -129,9 +107,7 @@ class Suxamethonium:
     def __str__(self):
         # print("%s for intubation %.0f mg (5-10 mins).".format(
         #    self.name, 1.5 * self.parent.weight))
-        info = "{} IBW intubation 5-10 mins relaxation: {:.0f} mg adult, {:.0f} mg child.".format(
-            self.name, 1.5 * self.parent.weight_ideal, self.parent.weight_ideal
-        )
+        info = f"{self.name} IBW intubation 5-10 mins relaxation: {1.5 * self.parent.weight_ideal:.0f} mg adult, {self.parent.weight_ideal:.0f} mg child."
         info += f" Max maintenance dose {self.parent.weight_ideal:.0f} mg every 5 mins (all ages)."
         return info
 
@@ -197,19 +173,12 @@ class Atracurium:
         # -30 % for isoflurane
 
     def __str__(self):
-        info = "{} load {:.0f}-{:.0f} mg ({:.0f}-{:.0f} mg -30% for isoflurane) for 15-35 mins of full block + 35 extra mins for recovery.".format(
-            self.name,
-            0.3 * self.parent.weight,
-            0.6 * self.parent.weight,
-            percent_corr(0.3 * self.parent.weight, -30),
-            percent_corr(0.6 * self.parent.weight, -30),
-        )
-        info += " {:.0f}-{:.0f} mg ({:.0f}-{:.0f} mg -30% for isoflurane) to prolong full block.".format(
-            0.1 * self.parent.weight,
-            0.2 * self.parent.weight,
-            percent_corr(0.1 * self.parent.weight, -30),
-            percent_corr(0.2 * self.parent.weight, -30),
-        )
+        load_min = 0.3 * self.parent.weight
+        load_max = 0.6 * self.parent.weight
+        maint_min = 0.1 * self.parent.weight
+        maint_max = 0.2 * self.parent.weight
+        info = f"{self.name} load {load_min:.0f}-{load_max:.0f} mg ({percent_corr(load_min, -30):.0f}-{percent_corr(load_max, -30):.0f} mg -30% for isoflurane) for 15-35 mins of full block + 35 extra mins for recovery."
+        info += f" {maint_min:.0f}-{maint_max:.0f} mg ({percent_corr(maint_min, -30):.0f}-{percent_corr(maint_max, -30):.0f} mg -30% for isoflurane) to prolong full block."
         info += " Same dosage for all ages."
         return info
 
@@ -222,23 +191,12 @@ class Pipecuronium:
         self.name = "Pipecuronium"
 
     def __str__(self):
+        w = self.parent.weight
         info = ""
         if self.parent.sex in (human.HumanSex.male, human.HumanSex.female):
-            info += "{} adult mono intubation {:.2f}-{:.2f} mg for 60-90 min; load after Sux {:.2f} mg for 30-60 min. Maintenance {:.2f}-{:.2f} mg every 30-60 min.".format(
-                self.name,
-                0.06 * self.parent.weight,
-                0.08 * self.parent.weight,
-                0.05 * self.parent.weight,
-                0.01 * self.parent.weight,
-                0.02 * self.parent.weight,
-            )
+            info += f"{self.name} adult mono intubation {0.06 * w:.2f}-{0.08 * w:.2f} mg for 60-90 min; load after Sux {0.05 * w:.2f} mg for 30-60 min. Maintenance {0.01 * w:.2f}-{0.02 * w:.2f} mg every 30-60 min."
         elif self.parent.sex == human.HumanSex.child:
-            info += "{} child 3-12 mos {:.2f} mg (10-44 min), 1-14 yo {:.2f}-{:.2f} mg (18-52 min).".format(
-                self.name,
-                0.04 * self.parent.weight,
-                0.05 * self.parent.weight,
-                0.06 * self.parent.weight,
-            )
+            info += f"{self.name} child 3-12 mos {0.04 * w:.2f} mg (10-44 min), 1-14 yo {0.05 * w:.2f}-{0.06 * w:.2f} mg (18-52 min)."
         return info
 
 
@@ -254,26 +212,31 @@ class Rocuronium:
         # 60 seconds before intubation
 
     def __str__(self):
-        info = "{} intubation {:.0f} mg (30-40 mins before <25% recovery). NMT maintenance:\n".format(
-            self.name, 0.6 * self.parent.weight
-        )
-        info += (
-            " * bolus: <1h {:.0f} mg; >1h {:.0f}-{:.0f} mg [2-3 TOF, <25%]\n".format(
-                self.parent.weight * 0.15,
-                self.parent.weight * 0.075,
-                self.parent.weight * 0.1,
-            )
-        )
-        info += " * pump: TIVA {:.0f}-{:.0f} mg/h; GA {:.0f}-{:.0f} mg/h [1-2 TOF, <10%]\n".format(
-            self.parent.weight * 0.3,
-            self.parent.weight * 0.6,
-            self.parent.weight * 0.3,
-            self.parent.weight * 0.4,
-        )
+        w = self.parent.weight
+        info = f"{self.name} intubation {0.6 * w:.0f} mg (30-40 mins before <25% recovery). NMT maintenance:\n"
+        info += f" * bolus: <1h {w * 0.15:.0f} mg; >1h {w * 0.075:.0f}-{w * 0.1:.0f} mg [2-3 TOF, <25%]\n"
+        info += f" * pump: TIVA {w * 0.3:.0f}-{w * 0.6:.0f} mg/h; GA {w * 0.3:.0f}-{w * 0.4:.0f} mg/h [1-2 TOF, <10%]\n"
         info += "   Same dosage for all ages."
         return info
 
 
+def describe_pressor(pressor, weight):
+    """Generate pressor cheatsheet.
+
+    :param dict pressor: Pressor description
+    :param float weight: Human weight, kg.
+    """
+    dilution = pressor["weight"] / pressor["volume"]
+    out_str = f"{pressor['name']} ({pressor['weight']:3.0f} mg / {pressor['volume']:.0f} ml, {dilution:.2f} mg/ml) rate {pressor['speed_start']:.2f}-{pressor['speed_max']:>5.2f} mсg/kg/min"
+
+    speed_start_mgh = pressor["speed_start"] / 1000 * weight * 60
+    speed_start_mlh = speed_start_mgh / dilution
+    speed_max_mgh = pressor["speed_max"] / 1000 * weight * 60
+    speed_max_mlh = speed_max_mgh / dilution
+    out_str += f" ({speed_start_mgh:>4.1f}-{speed_max_mgh:>5.1f} mg/h, {speed_start_mlh:.1f}-{speed_max_mlh:>4.1f} ml/h)"
+    return out_str
+
+
 def percent_corr(i, corr):
     """Shift value by given percent.
 
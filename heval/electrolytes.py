@@ -5,8 +5,8 @@ Author: Eugene Dvoretsky
 
 from __future__ import annotations
 
-import textwrap
-from itertools import chain
+import bisect
+from functools import cached_property
 
 from heval import abg, human
 
@@ -42,6 +42,16 @@ norm_cGlu = (4.1, 6.1)  # mmol/L < 6.1 is perfect for septic patients
 norm_cGlu_target = (4.5, 10)  # ICU target range
 # Note: gap between lower norm_cGlu and norm_cGlu_target
 
+# Reference ranges as printed in reports
+norm_sbe_str = f"{norm_sbe[0]:.0f}-{norm_sbe[1]:.0f} mEq/L"
+norm_gap_str = f"{norm_gap[0]:.0f}-{norm_gap[1]:.0f} mEq/L"
+norm_mOsm_str = f"{norm_mOsm[0]:.0f}-{norm_mOsm[1]:.0f} mOsm/L"
+norm_K_str = f"{norm_K[0]:.1f}-{norm_K[1]:.1f} mmol/L"
+norm_Na_str = f"{norm_Na[0]:.0f}-{norm_Na[1]:.0f} mmol/L"
+norm_Cl_str = f"{norm_Cl[0]:.0f}-{norm_Cl[1]:.0f} mmol/L"
+norm_cGlu_str = f"{norm_cGlu[0]:.1f}-{norm_cGlu[1]:.1f} mmol/L"
+norm_cGlu_target_str = f"{norm_cGlu_target[0]:.1f}-{norm_cGlu_target[1]:.1f} mmol/L"
+
 # Various https://www.healthcare.uiowa.edu/path_handbook/appendix/heme/pediatric_normals.html
 hct_norm_male = (0.407, 0.503)
 hct_norm_female = (0.361, 0.443)
@@ -52,10 +62,33 @@ hb_norm_male = (13.5, 17.5)  # g/dl, 130-160 g/L
 hb_norm_female = (12.0, 15.5)  # g/dl, 120-140 g/L
 hb_norm_child = (11, 16)  # g/dl
 
+NaHCO3_notes = (
+    "Confirmed NaHCO₃ use cases:\n"
+    "  * Metabolic acidosis correction leads to decreased 28 day mortality only in AKI patients (target pH 7.3) [BICAR-ICU 2018]\n"
+    "  * TCA poisoning with prolonged QT interval (target pH 7.45-7.55 [Костюченко 204])\n"
+    "  * In hyperkalemia (when pH increases, K⁺ level decreases)\n"
+    "Main concepts of usage:\n"
+    "  * Must hyperventilate to make use of bicarbonate buffer\n"
+    "  * Control ABG after each NaHCO₃ infusion or every 4 hours\n"
+    "  * Target urine pH 8, serum 7.34 [ПосДеж, с 379]"
+)
+
 
 class HumanBloodModel:
     """Represents an human blood ABG status."""
 
+    # Derived values, dropped on any change of blood test results
+    _cached_prop = (
+        "sbe",
+        "hco3p",
+        "anion_gapk",
+        "anion_gap",
+        "sid_abbr",
+        "osmolarity",
+        "hct_calc",
+        "abg_stable",
+    )
+
     def __init__(self, parent=None):
         self.parent = parent
         self._int_prop = ("pH", "pCO2", "cK", "cNa", "cCl", "cGlu", "ctAlb", "ctHb")
@@ -73,10 +106,15 @@ class HumanBloodModel:
         self.ctHb = None  # g/dl, haemoglobin
         # self.ctBun = None  # May be for osmolarity in future
 
+    def __setattr__(self, name, value):
+        for prop in self._cached_prop:
+            self.__dict__.pop(prop, None)
+        super().__setattr__(name, value)
+
     def __str__(self):
-        int_prop = {}
-        for attr in chain(self._int_prop, self._txt_prop):
-            int_prop[attr] = getattr(self, attr)
+        int_prop = {
+            attr: getattr(self, attr) for attr in self._int_prop + self._txt_prop
+        }
         return f"HumanBlood: {int_prop}"
 
     def populate(self, properties):
@@ -90,12 +128,10 @@ class HumanBloodModel:
             Not applied properties
         :rtype: dict
         """
-        for item in self._int_prop:
-            if item in properties:
-                setattr(self, item, float(properties.pop(item)))
-        for item in self._txt_prop:
-            if item in properties:
-                setattr(self, item, properties.pop(item))
+        for item in properties.keys() & self._int_prop:
+            setattr(self, item, float(properties.pop(item)))
+        for item in properties.keys() & self._txt_prop:
+            setattr(self, item, properties.pop(item))
         return properties
 
     # def __str__(self):
@@ -104,15 +140,15 @@ class HumanBloodModel:
     # def is_init(self):
     #     pass
 
-    @property
+    @cached_property
     def sbe(self):
         return abg.calculate_cbase(self.pH, self.pCO2)
 
-    @property
+    @cached_property
     def hco3p(self):
         return abg.calculate_hco3p(self.pH, self.pCO2)
 
-    @property
+    @cached_property
     def anion_gapk(self):
         """Anion gap (K+), usually not used."""
         if self.cK is not None:
@@ -126,27 +162,32 @@ class HumanBloodModel:
         else:
             raise ValueError("No potassium specified")
 
-    @property
+    @cached_property
     def anion_gap(self):
         """Calculate anion gap without potassium. Preferred method."""
         return abg.calculate_anion_gap(
             Na=self.cNa, Cl=self.cCl, HCO3act=self.hco3p, albumin=self.ctAlb
         )
 
-    @property
+    @cached_property
     def sid_abbr(self):
         """Strong ion difference."""
         return abg.calculate_sid_abbr(self.cNa, self.cCl, self.ctAlb)
 
-    @property
+    @cached_property
     def osmolarity(self):
         return abg.calculate_osmolarity(self.cNa, self.cGlu)
 
-    @property
+    @cached_property
     def hct_calc(self):
         """Haematocrit."""
         return abg.calculate_hct(self.ctHb * 10 / M_Hb)
 
+    @cached_property
+    def abg_stable(self):
+        """ABG conclusion and tag by stable approach."""
+        return abg.abg_approach_stable(self.pH, self.pCO2)
+
     def describe_osmolarity(self):
         """Verbally describe osmolarity impact on human.
 
@@ -158,7 +199,6 @@ class HumanBloodModel:
             dehydration (osmotic diuresis)
             cGlu >30, mOsm >320, no acidosis and ketone bodies)
         """
-        info = ""
         if not all(
             v is not None
             for v in (
@@ -166,29 +206,29 @@ class HumanBloodModel:
                 self.cGlu,
             )
         ):
-            return info
+            return ""
 
-        info = "Osmolarity is "
+        info = ["Osmolarity is "]
         if self.osmolarity > norm_mOsm[1]:
-            info += "high"
+            info.append("high")
         elif self.osmolarity < norm_mOsm[0]:
-            info += "low"
+            info.append("low")
         else:
-            info += "ok"
-        info += f" {self.osmolarity:.0f} ({norm_mOsm[0]:.0f}-{norm_mOsm[1]:.0f} mOsm/L)"
+            info.append("ok")
+        info.append(f" {self.osmolarity:.0f} ({norm_mOsm_str})")
 
         # Hyperosmolarity flags
         # if self.osmolarity >=282: # mOsm/kg
         #     info += " vasopressin released"
         if self.osmolarity > 290:  # mOsm/kg
             # plasma thirst point reached
-            info += ", human is thirsty (>290 mOsm/kg)"
+            info.append(", human is thirsty (>290 mOsm/kg)")
         if self.osmolarity > 320:  # mOsm/kg
             # >320 mOsm/kg Acute kidney injury cause https://www.ncbi.nlm.nih.gov/pubmed/9387687
-            info += ", acute kidney injury risk (>320 mOsm/kg)"
+            info.append(", acute kidney injury risk (>320 mOsm/kg)")
         if self.osmolarity > 330:  # mOsm/kg
             # >330 mOsm/kg hyperosmolar hyperglycemic coma https://www.ncbi.nlm.nih.gov/pubmed/9387687
-            info += ", coma (>330 mOsm/kg)"
+            info.append(", coma (>330 mOsm/kg)")
 
         # Implies cNa, pCO2 available
         if not all(
@@ -198,24 +238,25 @@ class HumanBloodModel:
                 self.pCO2,
             )
         ):
-            return info
+            return "".join(info)
 
         # SBE>-18.4 - same as (pH>7.3 and hco3p>15 mEq/L) https://emedicine.medscape.com/article/1914705-overview
-        if all((self.osmolarity > 320, self.cGlu > 30, self.sbe > -18.4)):
+        if self.osmolarity > 320 and self.cGlu > 30 and self.sbe > -18.4:
             # https://www.aafp.org/afp/2005/0501/p1723.html
             # IV insulin drip and crystalloids
-            info += " Diabetes mellitus type 2 with hyperosmolar hyperglycemic state? Check for HAGMA and ketonuria to exclude DKA. Look for infection or another underlying illness that caused the hyperglycemic crisis."
-        return info
+            info.append(
+                " Diabetes mellitus type 2 with hyperosmolar hyperglycemic state? Check for HAGMA and ketonuria to exclude DKA. Look for infection or another underlying illness that caused the hyperglycemic crisis."
+            )
+        return "".join(info)
 
     def describe_abg(self) -> str:
         """Describe pH and pCO2 - an old implementation considered stable."""
         if not all(v is not None for v in (self.pH, self.pCO2)):
             return ""
-        info = textwrap.dedent(
-            f"""\
-            pCO2    {self.pCO2:2.1f} kPa
-            HCO3(P) {self.hco3p:2.1f} mmol/L
-            Conclusion: {abg.abg_approach_stable(self.pH, self.pCO2)[0]}\n"""
+        info = (
+            f"pCO2    {self.pCO2:2.1f} kPa\n"
+            f"HCO3(P) {self.hco3p:2.1f} mmol/L\n"
+            f"Conclusion: {self.abg_stable[0]}\n"
         )
         if self.parent.debug:
             info += "\n-- Manual compensatory response check --------------\n"
@@ -228,27 +269,31 @@ class HumanBloodModel:
             v is not None for v in (self.pH, self.pCO2, self.cNa, self.cCl, self.ctAlb)
         ):
             return "pH, pCO2, cNa, cCl, albumin required"
-        info = "-- Anion gap ---------------------------------------\n"
-        desc = f"{self.anion_gap:.1f} ({norm_gap[0]:.0f}-{norm_gap[1]:.0f} mEq/L)"
-        if abg.abg_approach_stable(self.pH, self.pCO2)[1] == "metabolic_acidosis":
+        info = ["-- Anion gap ---------------------------------------\n"]
+        desc = f"{self.anion_gap:.1f} ({norm_gap_str})"
+        if self.abg_stable[1] == "metabolic_acidosis":
             if norm_gap[1] < self.anion_gap:
                 # Since AG elevated, calculate delta ratio to test for coexistent NAGMA or metabolic alkalosis
-                info += f"HAGMA {desc} (KULT?), "
-                info += abg.calculate_anion_gap_delta(self.anion_gap, self.hco3p)
+                info.append(f"HAGMA {desc} (KULT?), ")
+                info.append(abg.calculate_anion_gap_delta(self.anion_gap, self.hco3p))
             elif self.anion_gap < norm_gap[0]:
-                info += f"Low AG {desc} - hypoalbuminemia or low Na⁺?"
+                info.append(f"Low AG {desc} - hypoalbuminemia or low Na⁺?")
             else:
                 # Hypocorticism [Henessy 2018, с 113 (Clinical case 23)]
-                info += f"NAGMA {desc}. Diarrhea or renal tubular acidosis?"
+                info.append(f"NAGMA {desc}. Diarrhea or renal tubular acidosis?")
         else:
             if norm_gap[1] < self.anion_gap:
-                info += f"Unexpected high AG {desc} without main metabolic acidosis; "
+                info.append(
+                    f"Unexpected high AG {desc} without main metabolic acidosis; "
+                )
                 # Can catch COPD or concurrent metabolic alkalosis here
-                info += abg.calculate_anion_gap_delta(self.anion_gap, self.hco3p)
+                info.append(abg.calculate_anion_gap_delta(self.anion_gap, self.hco3p))
             elif self.anion_gap < norm_gap[0]:
-                info += f"Unexpected low AG {desc}. Starved patient with low albumin? Check your input and enter ctAlb if known."
+                info.append(
+                    f"Unexpected low AG {desc}. Starved patient with low albumin? Check your input and enter ctAlb if known."
+                )
             else:
-                info += f"AG is ok {desc}"
+                info.append(f"AG is ok {desc}")
 
         if self.parent.debug:
             """Strong ion difference.
@@ -259,15 +304,15 @@ class HumanBloodModel:
             """
             SIDabbr_norm = (-5, 5)  # Arbitrary threshold
             ref_str = f"{self.sid_abbr:.1f} ({SIDabbr_norm[0]:.0f}-{SIDabbr_norm[1]:.0f} mEq/L)"
-            info += "\nSIDabbr [Na⁺-Cl⁻-38] "
+            info.append("\nSIDabbr [Na⁺-Cl⁻-38] ")
             if self.sid_abbr > SIDabbr_norm[1]:
-                info += f"is alkalotic {ref_str}, relative Na⁺ excess"
+                info.append(f"is alkalotic {ref_str}, relative Na⁺ excess")
             elif self.sid_abbr < SIDabbr_norm[0]:
-                info += f"is acidotic {ref_str}, relative Cl⁻ excess"
+                info.append(f"is acidotic {ref_str}, relative Cl⁻ excess")
             else:
-                info += f"is ok {ref_str}"
-            info += f", BDE gap {self.sbe - self.sid_abbr:.01f} mEq/L"  # Lactate?
-        return info
+                info.append(f"is ok {ref_str}")
+            info.append(f", BDE gap {self.sbe - self.sid_abbr:.01f} mEq/L")  # Lactate?
+        return "".join(info)
 
     def describe_sbe(self):
         """Calculate needed NaHCO3 for metabolic acidosis correction.
@@ -300,49 +345,49 @@ class HumanBloodModel:
         if not all(v is not None for v in (self.pH, self.pCO2)):
             return ""
         NaHCO3_threshold = -15  # was -9 mEq/L
-        info = ""
+        info = []
         if self.sbe > norm_sbe[1]:
             # FIXME: can be high if chloride is low. Calculate SID?
             # https://www.ncbi.nlm.nih.gov/pmc/articles/PMC2856150
             # https://en.wikipedia.org/wiki/Contraction_alkalosis
             # Acetazolamide https://en.wikipedia.org/wiki/Carbonic_anhydrase_inhibitor
-            info += f"SBE is high {self.sbe:.1f} ({norm_sbe[0]:.0f}-{norm_sbe[1]:.0f} mEq/L). Low Cl⁻, hypoalbuminemia? NaHCO₃ overdose?"
+            info.append(
+                f"SBE is high {self.sbe:.1f} ({norm_sbe_str}). Low Cl⁻, hypoalbuminemia? NaHCO₃ overdose?"
+            )
         elif self.sbe < norm_sbe[0]:
             if self.sbe <= NaHCO3_threshold:
-                info += f"SBE is drastically low {self.sbe:.1f} ({norm_sbe[0]:.0f}-{norm_sbe[1]:.0f} mEq/L), consider NaHCO₃ in AKI patients to reach target pH 7.3:\n"
-                info += "  * Fast ACLS tip (all ages): load dose 1 mmol/kg, then 0.5 mmol/kg every 10 min [Курек 2013, 273]\n"
+                info.append(
+                    f"SBE is drastically low {self.sbe:.1f} ({norm_sbe_str}), consider NaHCO₃ in AKI patients to reach target pH 7.3:\n"
+                )
+                info.append(
+                    "  * Fast ACLS tip (all ages): load dose 1 mmol/kg, then 0.5 mmol/kg every 10 min [Курек 2013, 273]\n"
+                )
                 # info += "NaHCO3 {:.0f} mmol during 30-60 minutes\n".format(0.5 * (24 - self.hco3p) * self.parent.weight)  # Doesn't looks accurate, won't use it [Курек 2013, с 47]
                 NaHCO3_mmol = -0.3 * self.sbe * self.parent.weight  # mmol/L
                 NaHCO3_mmol_24h = self.parent.weight * 5  # mmol/L
                 NaHCO3_g = NaHCO3_mmol / 1000 * M_NaHCO3  # gram
                 NaHCO3_g_24h = NaHCO3_mmol_24h / 1000 * M_NaHCO3
                 # Курек 273, Рябов 73 for children and adult
-                info += f"  * NaHCO₃ {NaHCO3_mmol:.0f} mmol (-0.3*SBE/kg) during 30-60 min, daily dose {NaHCO3_mmol_24h:.0f} mmol/24h (5 mmol/kg/24h):\n"
+                info.append(
+                    f"  * NaHCO₃ {NaHCO3_mmol:.0f} mmol (-0.3*SBE/kg) during 30-60 min, daily dose {NaHCO3_mmol_24h:.0f} mmol/24h (5 mmol/kg/24h):\n"
+                )
                 # info += "  * NaHCO₃ {:.0f} mmol (-(SBE - 8)/kg/4)\n".format(
                 #     -(self.sbe - 8) * self.parent.weight / 4, NaHCO3_mmol_24h)  # Плохой 152
                 for dilution in (4, 8.4):
                     NaHCO3_ml = NaHCO3_g / dilution * 100
                     NaHCO3_ml_24h = NaHCO3_g_24h / dilution * 100
-                    info += f"    * NaHCO3 {dilution:.1f}% {NaHCO3_ml:.0f} ml, daily dose {NaHCO3_ml_24h:.0f} ml/24h\n"
-                if self.parent.debug:
-                    info += textwrap.dedent(
-                        """\
-                        Confirmed NaHCO₃ use cases:
-                          * Metabolic acidosis correction leads to decreased 28 day mortality only in AKI patients (target pH 7.3) [BICAR-ICU 2018]
-                          * TCA poisoning with prolonged QT interval (target pH 7.45-7.55 [Костюченко 204])
-                          * In hyperkalemia (when pH increases, K⁺ level decreases)
-                        Main concepts of usage:
-                          * Must hyperventilate to make use of bicarbonate buffer
-                          * Control ABG after each NaHCO₃ infusion or every 4 hours
-                          * Target urine pH 8, serum 7.34 [ПосДеж, с 379]"""
+                    info.append(
+                        f"    * NaHCO3 {dilution:.1f}% {NaHCO3_ml:.0f} ml, daily dose {NaHCO3_ml_24h:.0f} ml/24h\n"
                     )
+                if self.parent.debug:
+                    info.append(NaHCO3_notes)
             else:
-                info += f"SBE is low {self.sbe:.1f} ({norm_sbe[0]:.0f}-{norm_sbe[1]:.0f} mEq/L), but NaHCO₃ won't improve outcome when BE > {NaHCO3_threshold:.0f} mEq/L"
+                info.append(
+                    f"SBE is low {self.sbe:.1f} ({norm_sbe_str}), but NaHCO₃ won't improve outcome when BE > {NaHCO3_threshold:.0f} mEq/L"
+                )
         else:
-            info += (
-                f"SBE is ok {self.sbe:.1f} ({norm_sbe[0]:.0f}-{norm_sbe[1]:.0f} mEq/L)"
-            )
-        return info
+            info.append(f"SBE is ok {self.sbe:.1f} ({norm_sbe_str})")
+        return "".join(info)
 
     def describe_electrolytes(self):
         if not all(
@@ -372,7 +417,6 @@ class HumanBloodModel:
         https://en.wikipedia.org/wiki/Renal_threshold
         https://en.wikipedia.org/wiki/Glycosuria
         """
-        info = ""
         if not all(
             v is not None
             for v in (
@@ -380,33 +424,53 @@ class HumanBloodModel:
                 self.cGlu,
             )
         ):
-            return info
+            return ""
+
+        info = []
         if self.cGlu > norm_cGlu[1]:
             if self.cGlu <= norm_cGlu_target[1]:
-                info += f"cGlu is above ideal {self.cGlu:.1f} (target {norm_cGlu_target[0]:.1f}-{norm_cGlu_target[1]:.1f} mmol/L), but acceptable"
+                info.append(
+                    f"cGlu is above ideal {self.cGlu:.1f} (target {norm_cGlu_target_str}), but acceptable"
+                )
             else:
-                info += f"Hyperglycemia {self.cGlu:.1f} (target {norm_cGlu_target[0]:.1f}-{norm_cGlu_target[1]:.1f} mmol/L) causes glycosuria with osmotic diuresis"
+                info.append(
+                    f"Hyperglycemia {self.cGlu:.1f} (target {norm_cGlu_target_str}) causes glycosuria with osmotic diuresis"
+                )
                 if self.cGlu <= 20:  # Arbitrary threshold
-                    info += f", consider insulin {insulin_by_glucose(self.cGlu):.0f} IU subcut for adult"
+                    info.append(
+                        f", consider insulin {insulin_by_glucose(self.cGlu):.0f} IU subcut for adult"
+                    )
                 else:
-                    info += f", refer to DKE/HHS protocol (HAGMA and urine ketone), start fluid and I/V insulin {self.parent.weight * 0.1:.1f} IU/h (0.1 IU/kg/h)"
+                    info.append(
+                        f", refer to DKE/HHS protocol (HAGMA and urine ketone), start fluid and I/V insulin {self.parent.weight * 0.1:.1f} IU/h (0.1 IU/kg/h)"
+                    )
 
         elif self.cGlu < norm_cGlu[0]:
             if self.cGlu > 3:  # Hypoglycemia <3.3 mmol/L for pregnant?
-                info += f"cGlu is below ideal {self.cGlu:.1f} (target {norm_cGlu_target[0]:.1f}-{norm_cGlu_target[1]:.1f} mmol/L), repeat blood work, don't miss hypoglycemic state"
+                info.append(
+                    f"cGlu is below ideal {self.cGlu:.1f} (target {norm_cGlu_target_str}), repeat blood work, don't miss hypoglycemic state"
+                )
             else:
-                info += "Severe hypoglycemia, IMMEDIATELY INJECT BOLUS GLUCOSE 10 % 2.5 mL/kg:\n"
+                info.append(
+                    "Severe hypoglycemia, IMMEDIATELY INJECT BOLUS GLUCOSE 10 % 2.5 mL/kg:\n"
+                )
                 # https://litfl.com/glucose/
                 # For all ages: dextrose 10% bolus 2.5 mL/kg (0.25 g/kg) [mistake Курек, с 302]
-                info += solution_glucose(
-                    0.25 * self.parent.weight, self.parent.weight, add_insuline=False
+                info.append(
+                    solution_glucose(
+                        0.25 * self.parent.weight,
+                        self.parent.weight,
+                        add_insuline=False,
+                    )
                 )
                 # High lactate + refractory low cGlu marks liver failure: expect death in 24-48 hours
-                info += "Check cGlu after 20 min, repeat bolus and use continuous infusion, if refractory. In case of sepsis, liver failure may be the cause."
+                info.append(
+                    "Check cGlu after 20 min, repeat bolus and use continuous infusion, if refractory. In case of sepsis, liver failure may be the cause."
+                )
 
         else:
-            info += f"cGlu is ok {self.cGlu:.1f} ({norm_cGlu[0]:.1f}-{norm_cGlu[1]:.1f} mmol/L)"
-        return info
+            info.append(f"cGlu is ok {self.cGlu:.1f} ({norm_cGlu_str})")
+        return "".join(info)
 
     def describe_albumin(self):
         """Albumin as nutrition marker in adults."""
@@ -484,20 +548,24 @@ class HumanBloodModel:
         info = ""
         info += "Basic ABG assessment\n"
         info += "====================\n"
-        info += "{}\n".format(self.describe_abg())
-        info += "{}\n\n\n".format(self.describe_sbe())
+        info += f"{self.describe_abg()}\n"
+        info += f"{self.describe_sbe()}\n\n\n"
 
         info += "Complex electrolyte assessment\n"
         info += "==============================\n"
-        info += "{}\n\n".format(self.describe_anion_gap())
-        info += "{}\n".format(self.describe_electrolytes())
+        info += f"{self.describe_anion_gap()}\n\n"
+        info += f"{self.describe_electrolytes()}\n"
 
-        info += "{}\n\n".format(self.describe_glucose())
-        info += "{}\n\n".format(self.describe_albumin())
-        info += "{}\n".format(self.describe_Hb())
+        info += f"{self.describe_glucose()}\n\n"
+        info += f"{self.describe_albumin()}\n\n"
+        info += f"{self.describe_Hb()}\n"
         return info
 
 
+# Glucose solution strength, % and label suffix
+glucose_dilutions = ((5, " isotonic"), (10, ""), (40, ""))
+
+
 def solution_glucose(
     glu_mass: float, body_weight: float, add_insuline: bool = True
 ) -> str:
@@ -528,23 +596,22 @@ def solution_glucose(
     # This rate correlates with normal liver glucose production rate
     # 5-8 mg/kg/min in an infant and about 3-5 mg/kg/min in an older child
     # https://emedicine.medscape.com/article/921936-treatment
-    info = f"Glu {glu_mass:.1f} g ({glu_mol:.2f} mmol, {glu_mass * 4.1:.0f} kcal)"
+    info = [f"Glu {glu_mass:.1f} g ({glu_mol:.2f} mmol, {glu_mass * 4.1:.0f} kcal)"]
     if add_insuline:
         ins_dosage = 0.25  # IU/g
         insulinum = glu_mass * ins_dosage
-        info += f" + Ins {insulinum:.1f} IU ({ins_dosage:.2f} IU/g)"
-    info += ":\n"
+        info.append(f" + Ins {insulinum:.1f} IU ({ins_dosage:.2f} IU/g)")
+    info.append(":\n")
 
-    for dilution in (5, 10, 40):
-        g_low, g_max = 0.15, 0.5  # g/kg/h
+    g_low, g_max = 0.15, 0.5  # g/kg/h
+    for dilution, suffix in glucose_dilutions:
         speed_low = (g_low * body_weight) / dilution * 100
         speed_max = (g_max * body_weight) / dilution * 100
         vol = glu_mass / dilution * 100
-        info += f" * Glu {dilution:>2.0f}% {vol:>4.0f} ml ({speed_low:>3.0f}-{speed_max:>3.0f} ml/h = {g_low:.3f}-{g_max:.2f} g/kg/h)"
-        if dilution == 5:
-            info += " isotonic"
-        info += "\n"
-    return info
+        info.append(
+            f" * Glu {dilution:>2.0f}% {vol:>4.0f} ml ({speed_low:>3.0f}-{speed_max:>3.0f} ml/h = {g_low:.3f}-{g_max:.2f} g/kg/h){suffix}\n"
+        )
+    return "".join(info)
 
 
 def solution_kcl4(salt_mmol: float) -> float:
@@ -559,6 +626,13 @@ def solution_kcl4(salt_mmol: float) -> float:
     return salt_mmol / 1000 * M_KCl / 4 * 100
 
 
+# NaCl solution strength, %, its concentration, mmol/ml and label suffix
+saline_dilutions = tuple(
+    (dilution, 1000 * (dilution / 100) / M_NaCl, suffix)
+    for dilution, suffix in ((0.9, " isotonic"), (3, ""), (5, ""), (10, ""))
+)
+
+
 def solution_normal_saline(salt_mmol: float, hours: float | None = None) -> str:
     """Convert mmol of NaCl to volume of saline solution (several dilutions).
 
@@ -577,18 +651,14 @@ def solution_normal_saline(salt_mmol: float, hours: float | None = None) -> str:
     Returns:
         Info string
     """
-    info = ""
-    for dilution in (0.9, 3, 5, 10):
-        conc = 1000 * (dilution / 100) / M_NaCl  # mmol/ml
+    info = []
+    for dilution, conc, suffix in saline_dilutions:
         vol = salt_mmol / conc  # ml
         if hours is None:
-            info += f" * NaCl {dilution:>4.1f}% {vol:>4.0f} ml"
+            info.append(f" * NaCl {dilution:>4.1f}% {vol:>4.0f} ml{suffix}\n")
         else:
-            info += f" * NaCl {dilution:>4.1f}% {vol / hours:>4.0f} ml/h"
-        if dilution == 0.9:
-            info += " isotonic"
-        info += "\n"
-    return info
+            info.append(f" * NaCl {dilution:>4.1f}% {vol / hours:>4.0f} ml/h{suffix}\n")
+    return "".join(info)
 
 
 def electrolyte_Na_classic(
@@ -614,22 +684,44 @@ def electrolyte_Na_classic(
     Returns:
         Text describing Na deficit/excess and solutions dosage to correct.
     """
-    info = ""
+    info = []
     Na_shift_hours = abs(Na_target - Na_serum) / Na_shift_rate
     if Na_serum > Na_target:
         # Classic hypernatremia formula
         # water_deficit = total_body_water * (Na_serum - Na_target) / Na_target * 1000  # Equal
         water_deficit = total_body_water * (Na_serum / Na_target - 1) * 1000  # ml
-        info += f"Free water deficit is {water_deficit:.0f} ml, "
-        info += f"replace it with D5 at rate {water_deficit / Na_shift_hours:.1f} ml/h during {Na_shift_hours:.0f} hours.\n"
+        info.append(f"Free water deficit is {water_deficit:.0f} ml, ")
+        info.append(
+            f"replace it with D5 at rate {water_deficit / Na_shift_hours:.1f} ml/h during {Na_shift_hours:.0f} hours.\n"
+        )
     elif Na_serum < Na_target:
         # Classic hyponatremia formula
         Na_deficit = total_body_water * (Na_target - Na_serum)  # mmol
-        info += f"Na⁺ deficit is {Na_deficit:.0f} mmol, which equals to:\n"
-        info += solution_normal_saline(Na_deficit)
-        info += f"Replace Na⁺ at rate {Na_shift_rate:.1f} mmol/L/h during {Na_shift_hours:.0f} hours:\n"
-        info += solution_normal_saline(Na_deficit, Na_shift_hours)
-    return info
+        info.append(f"Na⁺ deficit is {Na_deficit:.0f} mmol, which equals to:\n")
+        info.append(solution_normal_saline(Na_deficit))
+        info.append(
+            f"Replace Na⁺ at rate {Na_shift_rate:.1f} mmol/L/h during {Na_shift_hours:.0f} hours:\n"
+        )
+        info.append(solution_normal_saline(Na_deficit, Na_shift_hours))
+    return "".join(info)
+
+
+# Solution name, Na⁺ and K⁺ content, mmol/L
+adrogue_solutions = (
+    # Hyper
+    ("NaCl 5%         (Na⁺ 855 mmol/L)", 855, 0),
+    ("NaCl 3%         (Na⁺ 513 mmol/L)", 513, 0),
+    ("NaHCO3 4%       (Na⁺ 476 mmol/L)", 476, 0),
+    ("NaCl 0.9%       (Na⁺ 154 mmol/L)", 154, 0),
+    # Iso
+    ("Sterofundin ISO (Na⁺ 145 mmol/L)", 145, 4),  # BBraun
+    ("Ionosteril      (Na⁺ 137 mmol/L)", 137, 4),  # Fresenius Kabi
+    ("Lactate Ringer  (Na⁺ 130 mmol/L)", 130, 4),  # Hartmann's solution
+    # Hypo
+    ("NaCl 0.45%      (Na⁺  77 mmol/L)", 77, 0),
+    ("NaCl 0.2%       (Na⁺  34 mmol/L)", 34, 0),
+    ("D5W or water    (Na⁺   0 mmol/L)", 0, 0),
+)
 
 
 def electrolyte_Na_adrogue(
@@ -663,38 +755,9 @@ def electrolyte_Na_adrogue(
     Returns:
             Text describing Na deficit/excess and solutions dosage to correct.
     """
-    solutions: list[dict[str, str | float]] = [
-        # Hyper
-        {"name": "NaCl 5%         (Na⁺ 855 mmol/L)", "K_inf": 0, "Na_inf": 855},
-        {"name": "NaCl 3%         (Na⁺ 513 mmol/L)", "K_inf": 0, "Na_inf": 513},
-        {"name": "NaHCO3 4%       (Na⁺ 476 mmol/L)", "K_inf": 0, "Na_inf": 476},
-        {"name": "NaCl 0.9%       (Na⁺ 154 mmol/L)", "K_inf": 0, "Na_inf": 154},
-        # Iso
-        {
-            "name": "Sterofundin ISO (Na⁺ 145 mmol/L)",
-            "K_inf": 4,
-            "Na_inf": 145,
-        },  # BBraun
-        {
-            "name": "Ionosteril      (Na⁺ 137 mmol/L)",
-            "K_inf": 4,
-            "Na_inf": 137,
-        },  # Fresenius Kabi
-        {
-            "name": "Lactate Ringer  (Na⁺ 130 mmol/L)",
-            "K_inf": 4,
-            "Na_inf": 130,
-        },  # Hartmann's solution
-        # Hypo
-        {"name": "NaCl 0.45%      (Na⁺  77 mmol/L)", "K_inf": 0, "Na_inf": 77},
-        {"name": "NaCl 0.2%       (Na⁺  34 mmol/L)", "K_inf": 0, "Na_inf": 34},
-        {"name": "D5W or water    (Na⁺   0 mmol/L)", "K_inf": 0, "Na_inf": 0},
-    ]
     Na_shift_hours = abs(Na_target - Na_serum) / Na_shift_rate
-    info = ""
-    for sol in solutions:
-        Na_inf = float(sol["Na_inf"])
-        K_inf = float(sol["K_inf"])
+    info = []
+    for name, Na_inf, K_inf in adrogue_solutions:
         if Na_serum == (Na_inf + K_inf):
             # Prevent zero division if solution same as the patient Na
             continue
@@ -711,8 +774,10 @@ def electrolyte_Na_adrogue(
             # Will lead to volume overload, not an option
             # Using 50000 ml threshold to cut off unreal volumes
             continue
-        info += f" * {sol['name']:<15} {vol:>6.0f} ml, {vol / Na_shift_hours:6.1f} ml/h during {Na_shift_hours:.0f} hours\n"
-    return info
+        info.append(
+            f" * {name:<15} {vol:>6.0f} ml, {vol / Na_shift_hours:6.1f} ml/h during {Na_shift_hours:.0f} hours\n"
+        )
+    return "".join(info)
 
 
 def electrolyte_K(weight: float, K_serum: float) -> str:
@@ -768,35 +833,45 @@ def electrolyte_K(weight: float, K_serum: float) -> str:
     K_target = 5.0  # mmol/L Not from book
     K_low = 3.5  # Курек 132
 
-    info = ""
-    if K_serum > norm_K[1]:
+    K_norm_low, K_norm_high = norm_K
+
+    info = []
+    if K_serum > K_norm_high:
         if K_serum >= K_high:
             glu_mass = 0.5 * weight  # Child and adults
-            info += f"K⁺ is dangerously high (>{K_high:.1f} mmol/L)\n"
-            info += "Inject bolus 0.5 g/kg "
-            info += solution_glucose(glu_mass, weight)
-            info += "Or standard adult bolus Glu 40% 60 ml + Ins 10 IU [ПосДеж]\n"
+            info.append(f"K⁺ is dangerously high (>{K_high:.1f} mmol/L)\n")
+            info.append("Inject bolus 0.5 g/kg ")
+            info.append(solution_glucose(glu_mass, weight))
+            info.append("Or standard adult bolus Glu 40% 60 ml + Ins 10 IU [ПосДеж]\n")
             # Use NaHCO3 if K greater or equal 6 mmol/L [Курек 2013, 47, 131]
-            info += f"NaHCO₃ 8.4% {2 * weight:.0f} ml (RBWx2={2 * weight:.0f} mmol) [Курек 2013]\n"
-            info += "Don't forget salbutamol, furesemide, hyperventilation. If ECG changes, use Ca gluconate [PICU: Electrolyte Emergencies]"
+            info.append(
+                f"NaHCO₃ 8.4% {2 * weight:.0f} ml (RBWx2={2 * weight:.0f} mmol) [Курек 2013]\n"
+            )
+            info.append(
+                "Don't forget salbutamol, furesemide, hyperventilation. If ECG changes, use Ca gluconate [PICU: Electrolyte Emergencies]"
+            )
         else:
-            info += f"K⁺ on the upper acceptable border {K_serum:.1f} ({K_low:.1f}-{K_high:.1f} mmol/L)"
-    elif K_serum < norm_K[0]:
+            info.append(
+                f"K⁺ on the upper acceptable border {K_serum:.1f} ({K_low:.1f}-{K_high:.1f} mmol/L)"
+            )
+    elif K_serum < K_norm_low:
         if K_serum < K_low:
-            info += f"K⁺ is dangerously low (<{K_low:.1f} mmol/L). Often associated with low Mg²⁺ (should be at least 1 mmol/L) and low Cl⁻.\n"
-            info += "NB! Potassium calculations considered inaccurate, so use standard K⁺ replacement rate "
+            info.append(
+                f"K⁺ is dangerously low (<{K_low:.1f} mmol/L). Often associated with low Mg²⁺ (should be at least 1 mmol/L) and low Cl⁻.\n"
+            )
+            info.append(
+                "NB! Potassium calculations considered inaccurate, so use standard K⁺ replacement rate "
+            )
             if weight < 40:
-                info += "{:.1f}-{:.1f} mmol/h (KCl 4 % {:.1f}-{:.1f} ml/h)".format(
-                    0.25 * weight,
-                    0.5 * weight,
-                    solution_kcl4(0.25 * weight),
-                    solution_kcl4(0.5 * weight),
+                K_rate_low, K_rate_high = 0.25 * weight, 0.5 * weight  # mmol/h
+                info.append(
+                    f"{K_rate_low:.1f}-{K_rate_high:.1f} mmol/h (KCl 4 % {solution_kcl4(K_rate_low):.1f}-{solution_kcl4(K_rate_high):.1f} ml/h)"
                 )
             else:
-                info += "{:.0f}-{:.0f} mmol/h (KCl 4 % {:.1f}-{:.1f} ml/h)".format(
-                    10, 20, solution_kcl4(10), solution_kcl4(20)
+                info.append(
+                    f"10-20 mmol/h (KCl 4 % {solution_kcl4(10):.1f}-{solution_kcl4(20):.1f} ml/h)"
                 )
-            info += " and check ABG every 2-4 hours.\n"
+            info.append(" and check ABG every 2-4 hours.\n")
 
             # coefficient = 0.45  # новорождённые
             # coefficient = 0.4   # грудные
@@ -806,17 +881,21 @@ def electrolyte_K(weight: float, K_serum: float) -> str:
             K_deficit = (K_target - K_serum) * weight * coefficient
             # K_deficit += weight * 1  # mmol/kg/24h Should I also add daily requirement? https://nursemathmedblog.wordpress.com/2016/05/29/potassium-replacement-calculation/
 
-            info += f"Estimated K⁺ deficit is {K_deficit:.0f} mmol (KCl 4 % {solution_kcl4(K_deficit):.1f} ml) + "
+            info.append(
+                f"Estimated K⁺ deficit is {K_deficit:.0f} mmol (KCl 4 % {solution_kcl4(K_deficit):.1f} ml) + "
+            )
             if K_deficit > 4 * weight:
-                info += "Too much potassium for 24 hours"
+                info.append("Too much potassium for 24 hours")
 
             glu_mass = K_deficit * 2.5  # 2.5 g/mmol, ~10 kcal/mmol
-            info += solution_glucose(glu_mass, weight)
+            info.append(solution_glucose(glu_mass, weight))
         else:
-            info += f"K⁺ on lower acceptable border {K_serum:.1f} ({K_low:.1f}-{K_high:.1f} mmol/L)"
+            info.append(
+                f"K⁺ on lower acceptable border {K_serum:.1f} ({K_low:.1f}-{K_high:.1f} mmol/L)"
+            )
     else:
-        info += f"K⁺ is ok {K_serum:.1f} ({norm_K[0]:.1f}-{norm_K[1]:.1f} mmol/L)]"
-    return info
+        info.append(f"K⁺ is ok {K_serum:.1f} ({norm_K_str})]")
+    return "".join(info)
 
 
 def electrolyte_Na(
@@ -885,52 +964,74 @@ def electrolyte_Na(
     # coef = 0.45  # for adult elderly or malnourished females.
     total_body_water = weight * coef  # Liters
 
-    info = ""
-    desc = f"{Na_serum:.0f} ({norm_Na[0]:.0f}-{norm_Na[1]:.0f} mmol/L)"
-    if Na_serum > norm_Na[1]:
-        info += (
+    Na_norm_low, Na_norm_high = norm_Na
+
+    info = []
+    desc = f"{Na_serum:.0f} ({norm_Na_str})"
+    if Na_serum > Na_norm_high:
+        info.append(
             f"Na⁺ is high {desc}, check osmolarity. Give enteral water if possible. "
         )
-        info += f"Warning: Na⁺ decrement faster than {Na_shift_rate:.1f} mmol/L/h can cause cerebral edema.\n"
+        info.append(
+            f"Warning: Na⁺ decrement faster than {Na_shift_rate:.1f} mmol/L/h can cause cerebral edema.\n"
+        )
         if verbose:
-            info += "Classic replacement calculation: " + electrolyte_Na_classic(
+            info.append("Classic replacement calculation: ")
+            info.append(
+                electrolyte_Na_classic(
+                    total_body_water,
+                    Na_serum,
+                    Na_target=Na_target,
+                    Na_shift_rate=Na_shift_rate,
+                )
+            )
+        info.append("Adrogue replacement calculation:\n")
+        info.append(
+            electrolyte_Na_adrogue(
                 total_body_water,
                 Na_serum,
                 Na_target=Na_target,
                 Na_shift_rate=Na_shift_rate,
             )
-        info += "Adrogue replacement calculation:\n" + electrolyte_Na_adrogue(
-            total_body_water,
-            Na_serum,
-            Na_target=Na_target,
-            Na_shift_rate=Na_shift_rate,
         )
-    elif Na_serum < norm_Na[0]:
-        info += f"Na⁺ is low {desc}, expect cerebral edema leading to seizures, coma and death. "
-        info += f"Warning: Na⁺ replacement faster than {Na_shift_rate:.1f} mmol/L/h can cause osmotic central pontine myelinolysis.\n"
+    elif Na_serum < Na_norm_low:
+        info.append(
+            f"Na⁺ is low {desc}, expect cerebral edema leading to seizures, coma and death. "
+        )
+        info.append(
+            f"Warning: Na⁺ replacement faster than {Na_shift_rate:.1f} mmol/L/h can cause osmotic central pontine myelinolysis.\n"
+        )
         # N.B.! Hypervolemic patient has low Na because of diluted plasma,
         # so it needs furosemide, not extra Na administration.
         if verbose:
-            info += "Classic replacement calculation: " + electrolyte_Na_classic(
+            info.append("Classic replacement calculation: ")
+            info.append(
+                electrolyte_Na_classic(
+                    total_body_water,
+                    Na_serum,
+                    Na_target=Na_target,
+                    Na_shift_rate=Na_shift_rate,
+                )
+            )
+        info.append("Adrogue replacement calculation:\n")
+        info.append(
+            electrolyte_Na_adrogue(
                 total_body_water,
                 Na_serum,
                 Na_target=Na_target,
                 Na_shift_rate=Na_shift_rate,
             )
-        info += "Adrogue replacement calculation:\n" + electrolyte_Na_adrogue(
-            total_body_water,
-            Na_serum,
-            Na_target=Na_target,
-            Na_shift_rate=Na_shift_rate,
         )
     else:
-        info += f"Na⁺ is ok {desc}"
+        info.append(f"Na⁺ is ok {desc}")
 
     # Should corrected Na be used instead of Na_serum for replacement calculation?
     Na_corr = correct_Na_hyperosmolar(Na_serum, cGlu)
     if abs(Na_corr - Na_serum) > 5:  # Arbitrary threshold
-        info += f"\nHigh cGlu causes high osmolarity and apparent hyponatremia. Corrected Na⁺ is {Na_corr:.0f} mmol/L."
-    return info
+        info.append(
+            f"\nHigh cGlu causes high osmolarity and apparent hyponatremia. Corrected Na⁺ is {Na_corr:.0f} mmol/L."
+        )
+    return "".join(info)
 
 
 def correct_Na_hyperosmolar(cNa: float, cGlu: float) -> float:
@@ -1024,17 +1125,16 @@ def electrolyte_Cl(Cl_serum: float) -> str:
     Args:
         Cl_serum: mmol/L
     """
-    info = ""
-    Cl_low, Cl_high = norm_Cl[0], norm_Cl[1]
+    Cl_low, Cl_high = norm_Cl
     if Cl_serum > Cl_high:
-        info += f"Cl⁻ is high {Cl_serum:.0f} (>{Cl_high} mmol/L), excessive NaCl infusion or dehydration (check osmolarity)."
+        info = f"Cl⁻ is high {Cl_serum:.0f} (>{Cl_high} mmol/L), excessive NaCl infusion or dehydration (check osmolarity)."
     elif Cl_serum < Cl_low:
         # KCl replacement?
-        info += (
+        info = (
             f"Cl⁻ is low {Cl_serum:.0f} (<{Cl_low} mmol/L). Vomiting? Diuretics abuse?"
         )
     else:
-        info += f"Cl⁻ is ok {Cl_serum:.0f} ({norm_Cl[0]:.0f}-{norm_Cl[1]:.0f} mmol/L)"
+        info = f"Cl⁻ is ok {Cl_serum:.0f} ({norm_Cl_str})"
     return info
 
 
@@ -1102,6 +1202,13 @@ def egfr_ckd_epi(
     [1] A new equation to estimate glomerular filtration rate. Ann Intern Med. 2009;150(9):604-12.
     [2] https://en.wikipedia.org/wiki/Renal_function#Glomerular_filtration_rate
 
+    Examples
+    --------
+    >>> egfr_ckd_epi(human.HumanSex.male, 74.4, 27)
+    119.89964516114675
+    >>> egfr_ckd_epi(human.HumanSex.female, 100, 80, True)
+    53.08533043705145
+
     Args:
         sex: Choose 'male', 'female'.
         cCrea: Serum creatinine (IDMS-calibrated), μmol/L
@@ -1113,18 +1220,19 @@ def egfr_ckd_epi(
     """
     cCrea /= M_Crea  # to mg/dl
     if sex == human.HumanSex.male:
-        if cCrea <= 0.9:
-            egfr = 141 * (cCrea / 0.9) ** -0.411 * 0.993**age
-        else:
-            egfr = 141 * (cCrea / 0.9) ** -1.209 * 0.993**age
+        kappa, alpha, sex_k = 0.9, -0.411, 1.0
     elif sex == human.HumanSex.female:
-        if cCrea <= 0.7:
-            egfr = 141 * (cCrea / 0.7) ** -0.329 * 0.993**age * 1.018
-        else:
-            egfr = 141 * (cCrea / 0.7) ** -1.209 * 0.993**age * 1.018
+        kappa, alpha, sex_k = 0.7, -0.329, 1.018
     elif sex == human.HumanSex.child:
         raise ValueError("CKD-EPI eGFR for children not supported")
 
+    egfr = (
+        141
+        * min(cCrea / kappa, 1) ** alpha
+        * max(cCrea / kappa, 1) ** -1.209
+        * 0.993**age
+        * sex_k
+    )
     if black_skin:
         egfr *= 1.159
     return egfr
@@ -1166,22 +1274,28 @@ def egfr_schwartz(cCrea: float, height: float) -> float:
     return k * height * 100 / cCrea
 
 
+# CKD stage lower limits, mL/min/1.73 m2, and descriptions between them
+gfr_stage_limits = (15, 30, 45, 60, 90)
+gfr_stage_desc = (
+    "CKD5, kidney failure (<15 %). Needs dialysis or kidney transplant",
+    "CKD4, severe loss of kidney function (29-15 %). Be prepared for dialysis",
+    "CKD3b, moderate to severe loss of kidney function (44-30 %). Evaluate progression",
+    "CKD3a, mild to moderate loss of kidney function (59-45 %). Evaluate progression",
+    "CKD2 kidney damage with mild loss of kidney function (89-60 %). For most patients, a GFR over 60 mL/min/1.73 m2 is adequate",
+    "Normal kidney function if no proteinuria, otherwise CKD1 (90-100 %)",
+)
+
+
 def gfr_describe(gfr: float) -> str:
-    """Describe GFR value meaning and stage of Chronic Kidney Disease."""
-    if 90 <= gfr:
-        return "Normal kidney function if no proteinuria, otherwise CKD1 (90-100 %)"
-    elif 60 <= gfr < 90:
-        return "CKD2 kidney damage with mild loss of kidney function (89-60 %). For most patients, a GFR over 60 mL/min/1.73 m2 is adequate"
-    elif 45 <= gfr < 60:
-        return "CKD3a, mild to moderate loss of kidney function (59-45 %). Evaluate progression"
-    elif 30 <= gfr < 45:
-        return "CKD3b, moderate to severe loss of kidney function (44-30 %). Evaluate progression"
-    elif 15 <= gfr < 30:
-        return (
-            "CKD4, severe loss of kidney function (29-15 %). Be prepared for dialysis"
-        )
-    else:
-        return "CKD5, kidney failure (<15 %). Needs dialysis or kidney transplant"
+    """Describe GFR value meaning and stage of Chronic Kidney Disease.
+
+    Examples:
+        >>> gfr_describe(45)
+        'CKD3a, mild to moderate loss of kidney function (59-45 %). Evaluate progression'
+        >>> gfr_describe(14.9)
+        'CKD5, kidney failure (<15 %). Needs dialysis or kidney transplant'
+    """
+    return gfr_stage_desc[bisect.bisect_right(gfr_stage_limits, gfr)]
 
 
 def insulin_by_glucose(cGlu: float) -> float:
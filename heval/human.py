@@ -7,12 +7,9 @@ Function parameters tends to be in International System of Units.
 
 from __future__ import annotations
 
-import copy
 import math
-import textwrap
 import warnings
 from enum import IntEnum
-from itertools import chain
 
 from heval import drugs, electrolytes, nutrition
 
@@ -55,10 +52,10 @@ class HumanBodyModel:
         self.comment = dict()  # For warnings
 
     def __str__(self):
-        int_prop = {}
-        for attr in chain(self._int_prop, self._txt_prop):
-            int_prop[attr] = getattr(self, attr)
-        return "HumanBody: {}".format(str(int_prop))
+        int_prop = {
+            attr: getattr(self, attr) for attr in self._int_prop + self._txt_prop
+        }
+        return f"HumanBody: {int_prop}"
 
     def populate(self, properties):
         """Populate model from data structure.
@@ -69,13 +66,11 @@ class HumanBodyModel:
             Not applied properties (including nested models)
         :rtype: dict
         """
-        prop = copy.deepcopy(properties)  # Avoid changing passed object
-        for item in self._int_prop:
-            if item in prop:
-                setattr(self, item, float(prop.pop(item)))
-        for item in self._txt_prop:
-            if item in prop:
-                setattr(self, item, prop.pop(item))
+        prop = dict(properties)  # Avoid changing passed object
+        for item in prop.keys() & self._int_prop:
+            setattr(self, item, float(prop.pop(item)))
+        for item in prop.keys() & self._txt_prop:
+            setattr(self, item, prop.pop(item))
 
         # Push the rest of the dict deeper
         self.blood.populate(prop)
@@ -244,15 +239,15 @@ class HumanBodyModel:
         info = ""
         if not self.is_init():
             return "Empty human model (set sex, height, weight)"
-        info += "{}\n".format(self._info_in_body())
+        info += f"{self._info_in_body()}\n"
         info += "\n-- Respiration ---------------------------------\n"
-        info += "{}\n".format(self._info_in_respiration())
+        info += f"{self._info_in_respiration()}\n"
         info += "\n-- Fluids --------------------------------------\n"
-        info += "{}\n".format(self._info_in_fluids())
+        info += f"{self._info_in_fluids()}\n"
         info += "\n-- Metabolic -----------------------------------\n"
-        info += "{}\n".format(self._info_in_energy())
+        info += f"{self._info_in_energy()}\n"
         if self.debug:
-            info += "\n{}\n".format(self._info_in_food())
+            info += f"\n{self._info_in_food()}\n"
         # Estimate also CO2 production?
         info += "\n-- Diuresis ------------------------------------\n"
         info += f"{self._info_out_fluids()}\n"
@@ -277,9 +272,7 @@ class HumanBodyModel:
 
         # Value 70 ml/kg used in cardiopulmonary bypass. It valid for humans
         # older than 3 month. ml/kg ratio more in neonates and underweight
-        info += "Total blood volume {:.0f} ml (70 ml/kg) or {:.0f} ml (weight indexed by Lemmens). ".format(
-            self.weight * 70, self.total_blood_volume
-        )
+        info += f"Total blood volume {self.weight * 70:.0f} ml (70 ml/kg) or {self.total_blood_volume:.0f} ml (weight indexed by Lemmens). "
         info += f"Transfusion of one pRBC dose will increase Hb by {estimate_prbc_transfusion_response(self.weight):+.2f} g/dL."
 
         if self.sex == HumanSex.child:
@@ -1044,15 +1037,14 @@ def mnemonic_wetflag(age: float | None = None, weight: float | None = None) -> s
     fl = 20 * w  # Fluids (bolus), ml of isotonic fluid (caution in some cases)
     a = 10 * w  # Adrenaline 10 mcg/kg (1:10000 solution = 0.1 mL/kg)
     g = 2 * w  # 2 mL/kg Glucose 10 %
-    return textwrap.dedent(
-        f"""\
-        WETFLAG tip for {age:.1f} yo:
-          Weight           {w:>4.1f} kg  = (age + 4) * 2
-          Energy for defib {e:>4.0f} J   = 4 J/kg
-          Tube             {t:>4.1f} mm  = age / 4 + 4
-          Fluid bolus      {fl:>4.0f} ml  = 20 ml/kg of isotonic fluid
-          Adrenaline       {a:>4.0f} mcg = 10 mcg/kg
-          Glucose 10 %     {g:>4.0f} ml  = 2 mL/kg"""
+    return (
+        f"WETFLAG tip for {age:.1f} yo:\n"
+        f"  Weight           {w:>4.1f} kg  = (age + 4) * 2\n"
+        f"  Energy for defib {e:>4.0f} J   = 4 J/kg\n"
+        f"  Tube             {t:>4.1f} mm  = age / 4 + 4\n"
+        f"  Fluid bolus      {fl:>4.0f} ml  = 20 ml/kg of isotonic fluid\n"
+        f"  Adrenaline       {a:>4.0f} mcg = 10 mcg/kg\n"
+        f"  Glucose 10 %     {g:>4.0f} ml  = 2 mL/kg"
     )
 
 